@@ -11,7 +11,8 @@ Features:
   - Click a node to select it; edit text / type / x / y in the side panel.
   - Add / delete nodes.
   - Add / delete edges (with optional label).
-  - Every change is auto-saved to the JSON spec and the PNG is re-exported.
+  - Changes are auto-saved to the JSON spec (and the PNG re-exported) once
+    editing pauses, and on close.
 
 Also supports a non-UI render mode:
   python3 activity_diagram.py --render [SPEC.json] [OUT.png]
@@ -20,43 +21,72 @@ Also supports a non-UI render mode:
 from __future__ import annotations
 
 import json
+import queue
 import sys
+import threading
 from pathlib import Path
 
 import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.lines import Line2D
 from matplotlib.patches import FancyArrowPatch, FancyBboxPatch, Polygon
 
 
 # ---------- rendering ----------
 
+def _diamond_points(x, y, w, h):
+    return [(x, y + h * 0.9), (x + w * 0.7, y), (x, y - h * 0.9), (x - w * 0.7, y)]
+
+
+def _outline(selected):
+    """Edge colour and width for a node patch."""
+    return ("#FF1744", 2.4) if selected else ("black", 1.0)
+
+
 def draw_node(ax, x, y, text, shape, color, w, h, selected=False):
-    edge_color = "#FF1744" if selected else "black"
-    edge_width = 2.4 if selected else 1.0
+    """Draw one node; return its (patch, text) artists."""
+    edge_color, edge_width = _outline(selected)
     if shape == "diamond":
-        pts = [(x, y + h * 0.9), (x + w * 0.7, y), (x, y - h * 0.9), (x - w * 0.7, y)]
-        ax.add_patch(Polygon(pts, closed=True, facecolor=color,
-                             edgecolor=edge_color, linewidth=edge_width))
+        patch = Polygon(_diamond_points(x, y, w, h), closed=True, facecolor=color,
+                        edgecolor=edge_color, linewidth=edge_width)
     elif shape == "pill":
-        ax.add_patch(FancyBboxPatch((x - w / 2, y - h / 2), w, h,
-                                    boxstyle="round,pad=0.05,rounding_size=0.35",
-                                    facecolor=color, edgecolor=edge_color,
-                                    linewidth=edge_width))
+        patch = FancyBboxPatch((x - w / 2, y - h / 2), w, h,
+                               boxstyle="round,pad=0.05,rounding_size=0.35",
+                               facecolor=color, edgecolor=edge_color,
+                               linewidth=edge_width)
     elif shape == "sawtooth":
-        ax.add_patch(FancyBboxPatch((x - w / 2, y - h / 2), w, h,
-                                    boxstyle="sawtooth,pad=0.05",
-                                    facecolor=color, edgecolor=edge_color,
-                                    linewidth=edge_width, linestyle="--"))
+        patch = FancyBboxPatch((x - w / 2, y - h / 2), w, h,
+                               boxstyle="sawtooth,pad=0.05",
+                               facecolor=color, edgecolor=edge_color,
+                               linewidth=edge_width, linestyle="--")
     else:
-        ax.add_patch(FancyBboxPatch((x - w / 2, y - h / 2), w, h,
-                                    boxstyle="round,pad=0.04,rounding_size=0.12",
-                                    facecolor=color, edgecolor=edge_color,
-                                    linewidth=edge_width))
-    ax.text(x, y, text, ha="center", va="center", fontsize=7.2, wrap=True)
+        patch = FancyBboxPatch((x - w / 2, y - h / 2), w, h,
+                               boxstyle="round,pad=0.04,rounding_size=0.12",
+                               facecolor=color, edgecolor=edge_color,
+                               linewidth=edge_width)
+    ax.add_patch(patch)
+    label = ax.text(x, y, text, ha="center", va="center", fontsize=7.2, wrap=True)
+    return patch, label
+
+
+def set_node_selected(patch, selected):
+    edge_color, edge_width = _outline(selected)
+    patch.set_edgecolor(edge_color)
+    patch.set_linewidth(edge_width)
+
+
+def move_node(patch, label, x, y, w, h):
+    """Reposition the artists returned by draw_node."""
+    if isinstance(patch, Polygon):
+        patch.set_xy(_diamond_points(x, y, w, h))
+    else:
+        patch.set_bounds(x - w / 2, y - h / 2, w, h)
+    label.set_position((x, y))
 
 
 def draw_edge(ax, src_xy, dst_xy, label, style):
+    """Draw one edge; return its (arrow, label text or None) artists."""
     linestyle = "--" if style == "dashed" else "-"
     arrow = FancyArrowPatch(src_xy, dst_xy,
                             arrowstyle="-|>", mutation_scale=10,
@@ -64,13 +94,34 @@ def draw_edge(ax, src_xy, dst_xy, label, style):
                             color="#444", linewidth=0.9, linestyle=linestyle,
                             shrinkA=22, shrinkB=22)
     ax.add_patch(arrow)
+    text = None
     if label:
         mx, my = (src_xy[0] + dst_xy[0]) / 2, (src_xy[1] + dst_xy[1]) / 2
-        ax.text(mx, my, label, fontsize=6.5, color="#1565C0",
-                bbox=dict(facecolor="white", edgecolor="none", pad=1))
+        text = ax.text(mx, my, label, fontsize=6.5, color="#1565C0",
+                       bbox=dict(facecolor="white", edgecolor="none", pad=1))
+    return arrow, text
+
+
+def move_edge(arrow, text, src_xy, dst_xy):
+    """Reposition the artists returned by draw_edge."""
+    arrow.set_positions(src_xy, dst_xy)
+    if text is not None:
+        text.set_position(((src_xy[0] + dst_xy[0]) / 2, (src_xy[1] + dst_xy[1]) / 2))
+
+
+def _culled(bounds, xs, ys):
+    """True if the points xs/ys all lie on one side of bounds (x0, x1, y0, y1)."""
+    x0, x1, y0, y1 = bounds
+    return max(xs) < x0 or min(xs) > x1 or max(ys) < y0 or min(ys) > y1
 
 
 def render_to_ax(ax, spec, selected_id=None, view=None):
+    """Redraw the whole spec and return the artists for in-place updates.
+
+    Returns ({node id: (patch, text)}, [(from id, to id, arrow, label), ...]).
+    When a zoomed-in view is given, nodes and edges wholly outside it are
+    skipped and have no entry.
+    """
     canvas = spec.get("canvas", {})
     ax.clear()
     if view is not None:
@@ -89,18 +140,32 @@ def render_to_ax(ax, spec, selected_id=None, view=None):
     styles = spec.get("styles", {})
     nodes = {n["id"]: n for n in spec["nodes"]}
 
+    bounds = None
+    if view is not None:
+        # Pad by a node size so diamond tips and wrapped labels near the edge
+        # of the view are still drawn.
+        (x0, x1), (y0, y1) = sorted(view[0]), sorted(view[1])
+        bounds = (x0 - w, x1 + w, y0 - h, y1 + h)
+
+    edge_artists = []
     for edge in spec.get("edges", []):
         if edge["from"] not in nodes or edge["to"] not in nodes:
             continue
         s, d = nodes[edge["from"]], nodes[edge["to"]]
-        draw_edge(ax, (s["x"], s["y"]), (d["x"], d["y"]),
-                  edge.get("label", ""), edge.get("style", "solid"))
+        if bounds and _culled(bounds, (s["x"], d["x"]), (s["y"], d["y"])):
+            continue
+        arrow, text = draw_edge(ax, (s["x"], s["y"]), (d["x"], d["y"]),
+                                edge.get("label", ""), edge.get("style", "solid"))
+        edge_artists.append((edge["from"], edge["to"], arrow, text))
 
+    node_artists = {}
     for node in nodes.values():
+        if bounds and _culled(bounds, (node["x"],), (node["y"],)):
+            continue
         style = styles.get(node["type"], {"shape": "rounded", "color": "#CCCCCC"})
-        draw_node(ax, node["x"], node["y"], node["text"],
-                  style["shape"], style["color"], w, h,
-                  selected=(node["id"] == selected_id))
+        node_artists[node["id"]] = draw_node(ax, node["x"], node["y"], node["text"],
+                                             style["shape"], style["color"], w, h,
+                                             selected=(node["id"] == selected_id))
 
     legend_items = spec.get("legend", [])
     if legend_items:
@@ -113,15 +178,23 @@ def render_to_ax(ax, spec, selected_id=None, view=None):
                                   markerfacecolor=color, markersize=10, label=item["label"]))
         ax.legend(handles=handles, loc="lower left", fontsize=8, frameon=True)
 
+    return node_artists, edge_artists
+
 
 def render_png(spec_path: Path, out_path: Path) -> None:
     with spec_path.open() as f:
         spec = json.load(f)
+    render_spec_png(spec, out_path)
+
+
+def render_spec_png(spec: dict, out_path: Path) -> None:
+    # A bare Figure (no pyplot) stays off the TkAgg backend and pyplot's global
+    # figure manager; the editor calls this from its save thread and relies on
+    # matplotlib keeping its font cache per thread.
     figsize = spec.get("canvas", {}).get("figsize", [12, 12])
-    fig, ax = plt.subplots(figsize=figsize)
-    render_to_ax(ax, spec)
-    plt.savefig(out_path, dpi=150, bbox_inches="tight", facecolor="white")
-    plt.close(fig)
+    fig = Figure(figsize=figsize)
+    render_to_ax(fig.subplots(), spec)
+    fig.savefig(out_path, dpi=150, bbox_inches="tight", facecolor="white")
 
 
 # ---------- UI ----------
@@ -138,16 +211,37 @@ def _load_tk():
 
 class DiagramApp:
     HIT_RADIUS = 0.9  # data units
+    AUTOSAVE_DELAY_MS = 1500  # quiet time after the last edit before saving
+    SAVE_POLL_MS = 100  # how often to check on an in-flight save
 
     def __init__(self, root, spec_path: Path):
         self.root = root
         self.spec_path = spec_path
         self.png_path = spec_path.with_suffix(".png")
         self.spec = self._load()
+        self._reindex()
 
         self.selected_id: str | None = None
         self.drag_offset: tuple[float, float] | None = None
+        self._drag_pos: tuple[float, float] | None = None  # latest unapplied motion
+        self._drag_job = None  # pending after_idle id for _flush_drag
+        self._drag_moved = False  # did the current press actually move a node?
+        self._save_job = None  # pending after id for a debounced save
+        # Encoded specs waiting to be written + exported by _save_worker.
+        self._save_queue: queue.Queue[str] = queue.Queue()
+        # (snapshots covered, spec error, png error) per finished save, read
+        # back on the Tk thread.
+        self._save_results: queue.Queue[tuple[int, str | None, str | None]] = queue.Queue()
+        self._saves_pending = 0  # snapshots queued but not yet reported; Tk thread only
+        self._save_error: str | None = None  # outcome of the last spec write
+        self._poll_job = None  # pending after id for _poll_save_results
+        threading.Thread(target=self._save_worker, daemon=True).start()
         self.view: tuple[list[float], list[float]] | None = None  # zoom/pan state
+        # Artists from the last full redraw, for in-place updates.
+        self.node_artists: dict[str, tuple] = {}
+        self.edge_artists: list[tuple] = []
+        self.edges_by_node: dict[str, list[tuple]] = {}  # node id -> incident edge_artists
+        self._rendered_view = None  # view the artists were culled against
 
         root.title(f"Activity Diagram Editor — {spec_path.name}")
         root.geometry("1400x900")
@@ -171,7 +265,8 @@ class DiagramApp:
         self.canvas.mpl_connect("scroll_event", self._on_scroll)
 
         self._build_side_panel(right)
-        self.redraw()
+        self.redraw(edges_changed=True)
+        root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     # ----- persistence -----
 
@@ -179,14 +274,102 @@ class DiagramApp:
         with self.spec_path.open() as f:
             return json.load(f)
 
+    def _schedule_save(self) -> None:
+        """Save once edits pause, so a burst of changes costs a single write."""
+        if self._save_job is not None:
+            self.root.after_cancel(self._save_job)
+        self._save_job = self.root.after(self.AUTOSAVE_DELAY_MS, self.save)
+        self.status.set("Modified")
+
+    def _flush_save(self) -> None:
+        """Run any pending save, wait for the worker and report the outcome."""
+        if self._save_job is not None:
+            self.save()
+        self._save_queue.join()
+        self._report_save_results()
+
+    def _confirm_unsaved(self, action: str) -> bool:
+        """After a failed write, ask before an action that drops the edits."""
+        if self._save_error is None:
+            return True
+        return messagebox.askyesno(
+            "Save failed",
+            f"Could not save {self.spec_path.name}:\n{self._save_error}\n\n"
+            f"{action} anyway and lose the unsaved changes?")
+
+    def _on_close(self) -> None:
+        self._flush_save()
+        if not self._confirm_unsaved("Close"):
+            return
+        self.root.destroy()
+
     def save(self) -> None:
-        with self.spec_path.open("w") as f:
-            json.dump(self.spec, f, indent=2)
-        try:
-            render_png(self.spec_path, self.png_path)
-        except Exception as e:
-            print(f"PNG export failed: {e}", file=sys.stderr)
-        self.status.set(f"Saved {self.spec_path.name}")
+        if self._save_job is not None:
+            self.root.after_cancel(self._save_job)
+            self._save_job = None
+        # Encoding on the Tk thread doubles as the snapshot: later edits can't
+        # leak into a save that is already queued. The file write and the
+        # PNG export, which dominates save time, run on _save_worker.
+        self._save_queue.put(json.dumps(self.spec, indent=2))
+        self._saves_pending += 1
+        self.status.set(f"Saving {self.spec_path.name}…")
+        if self._poll_job is None:
+            self._poll_job = self.root.after(self.SAVE_POLL_MS, self._poll_save_results)
+
+    def _poll_save_results(self) -> None:
+        self._poll_job = None
+        self._report_save_results()
+        # The counter only drops when a result is read here, so a save that
+        # finishes mid-poll keeps polling alive until it is reported.
+        if self._saves_pending:
+            self._poll_job = self.root.after(self.SAVE_POLL_MS, self._poll_save_results)
+
+    def _report_save_results(self) -> None:
+        while True:
+            try:
+                taken, spec_error, png_error = self._save_results.get_nowait()
+            except queue.Empty:
+                return
+            self._saves_pending -= taken
+            self._save_error = spec_error
+            if spec_error is not None:
+                self.status.set(f"Save failed: {spec_error}")
+            elif self._save_job is not None:
+                pass  # edited again since this snapshot; still "Modified"
+            elif png_error is not None:
+                self.status.set(f"Saved {self.spec_path.name} (PNG export failed)")
+            else:
+                self.status.set(f"Saved {self.spec_path.name}")
+
+    def _save_worker(self) -> None:
+        while True:
+            text = self._save_queue.get()
+            taken = 1
+            # Only the newest snapshot matters; skip any superseded ones.
+            while True:
+                try:
+                    text = self._save_queue.get_nowait()
+                except queue.Empty:
+                    break
+                taken += 1
+            spec_error = png_error = None
+            try:
+                # json.dump() with indent issues one write() per encoded
+                # fragment; hand the file a single buffer instead.
+                self.spec_path.write_text(text)
+            except Exception as e:
+                spec_error = str(e)
+                print(f"Save failed: {e}", file=sys.stderr)
+            else:
+                try:
+                    render_spec_png(json.loads(text), self.png_path)
+                except Exception as e:
+                    png_error = str(e)
+                    print(f"PNG export failed: {e}", file=sys.stderr)
+            # Post the result before task_done() so a join() sees it.
+            self._save_results.put((taken, spec_error, png_error))
+            for _ in range(taken):
+                self._save_queue.task_done()
 
     # ----- UI building -----
 
@@ -257,10 +440,23 @@ class DiagramApp:
 
     # ----- redraw -----
 
-    def redraw(self):
-        render_to_ax(self.ax, self.spec, selected_id=self.selected_id, view=self.view)
+    def _render(self):
+        self.node_artists, self.edge_artists = render_to_ax(
+            self.ax, self.spec, selected_id=self.selected_id, view=self.view)
+        self._rendered_view = self.view
+        self.edges_by_node = {}
+        for entry in self.edge_artists:
+            self.edges_by_node.setdefault(entry[0], []).append(entry)
+            if entry[1] != entry[0]:
+                self.edges_by_node.setdefault(entry[1], []).append(entry)
+
+    def redraw(self, edges_changed: bool = False):
+        self._render()
         self.canvas.draw_idle()
-        self._refresh_edge_list()
+        # Repopulating the listbox is one Tk call per edge; skip it unless
+        # the edge list actually changed.
+        if edges_changed:
+            self._refresh_edge_list()
         self._refresh_selection_panel()
 
     def _refresh_edge_list(self):
@@ -286,11 +482,12 @@ class DiagramApp:
 
     # ----- helpers -----
 
+    def _reindex(self) -> None:
+        """Rebuild the id -> node lookup after the node list is replaced."""
+        self._nodes_by_id = {n["id"]: n for n in self.spec["nodes"]}
+
     def _node(self, nid: str) -> dict | None:
-        for n in self.spec["nodes"]:
-            if n["id"] == nid:
-                return n
-        return None
+        return self._nodes_by_id.get(nid)
 
     def _hit_test(self, x: float, y: float) -> str | None:
         size = self.spec.get("node_size", {"w": 2.6, "h": 0.7})
@@ -300,36 +497,82 @@ class DiagramApp:
                 return n["id"]
         return None
 
+    def _set_selected(self, nid: str | None) -> None:
+        """Move the selection highlight by restyling the two affected patches."""
+        if nid == self.selected_id:
+            return
+        old = self.node_artists.get(self.selected_id)
+        new = self.node_artists.get(nid)
+        self.selected_id = nid
+        if nid is not None and new is None:
+            self.redraw()
+            return
+        if old is not None:
+            set_node_selected(old[0], False)
+        if new is not None:
+            set_node_selected(new[0], True)
+        self._refresh_selection_panel()
+        self.canvas.draw_idle()
+
+    def _move_node_artists(self, node: dict) -> None:
+        """Follow a node's new x/y by moving its artists and incident arrows."""
+        artists = self.node_artists.get(node["id"])
+        if artists is None:
+            self._render()
+            return
+        size = self.spec.get("node_size", {"w": 2.6, "h": 0.7})
+        move_node(*artists, node["x"], node["y"], size["w"], size["h"])
+        for src, dst, arrow, text in self.edges_by_node.get(node["id"], ()):
+            s, d = self._node(src), self._node(dst)
+            move_edge(arrow, text, (s["x"], s["y"]), (d["x"], d["y"]))
+
     # ----- mouse handlers -----
 
     def _on_press(self, event):
         if event.inaxes != self.ax or event.xdata is None:
             return
         nid = self._hit_test(event.xdata, event.ydata)
-        self.selected_id = nid
+        self._set_selected(nid)
         if nid:
             node = self._node(nid)
             self.drag_offset = (node["x"] - event.xdata, node["y"] - event.ydata)
         else:
             self.drag_offset = None
-        self.redraw()
+        self._drag_moved = False
 
     def _on_motion(self, event):
         if (self.drag_offset is None or self.selected_id is None
                 or event.inaxes != self.ax or event.xdata is None):
             return
+        # Motion events arrive far faster than we can redraw; keep only the
+        # latest position and apply it once per idle tick.
+        self._drag_pos = (event.xdata, event.ydata)
+        if self._drag_job is None:
+            self._drag_job = self.root.after_idle(self._flush_drag)
+
+    def _flush_drag(self):
+        self._drag_job = None
+        if self._drag_pos is None or self.drag_offset is None or self.selected_id is None:
+            return
         node = self._node(self.selected_id)
-        node["x"] = event.xdata + self.drag_offset[0]
-        node["y"] = event.ydata + self.drag_offset[1]
-        render_to_ax(self.ax, self.spec, selected_id=self.selected_id, view=self.view)
+        node["x"] = self._drag_pos[0] + self.drag_offset[0]
+        node["y"] = self._drag_pos[1] + self.drag_offset[1]
+        self._drag_pos = None
+        self._drag_moved = True
+        self._move_node_artists(node)
         self.canvas.draw_idle()
         self.var_x.set(f'{node["x"]:.3f}')
         self.var_y.set(f'{node["y"]:.3f}')
 
     def _on_release(self, event):
         if self.drag_offset is not None:
+            if self._drag_job is not None:
+                self.root.after_cancel(self._drag_job)
+                self._flush_drag()
             self.drag_offset = None
-            self.save()
+            # A plain click selects without touching the file.
+            if self._drag_moved:
+                self._schedule_save()
 
     # ----- actions -----
 
@@ -339,16 +582,38 @@ class DiagramApp:
         node = self._node(self.selected_id)
         if node is None:
             return
+        # Parse everything before touching the node, so a bad X/Y leaves it
+        # exactly as it is drawn.
         try:
-            node["text"] = self.var_text.get()
-            node["type"] = self.var_type.get()
-            node["x"] = float(self.var_x.get())
-            node["y"] = float(self.var_y.get())
+            x = float(self.var_x.get())
+            y = float(self.var_y.get())
         except ValueError as e:
             messagebox.showerror("Invalid value", str(e))
             return
-        self.save()
-        self.redraw()
+        # The panel shows X/Y rounded to 3 places; a field that still matches
+        # that rounding is unchanged, so keep the exact value (e.g. after a drag).
+        if f"{x:.3f}" == f'{node["x"]:.3f}':
+            x = node["x"]
+        if f"{y:.3f}" == f'{node["y"]:.3f}':
+            y = node["y"]
+        old_type = node["type"]
+        before = (node["text"], node["type"], node["x"], node["y"])
+        node["text"] = self.var_text.get()
+        node["type"] = self.var_type.get()
+        node["x"] = x
+        node["y"] = y
+        if (node["text"], node["type"], node["x"], node["y"]) == before:
+            return
+        self._schedule_save()
+        artists = self.node_artists.get(node["id"])
+        if artists is None or node["type"] != old_type:
+            # A new type can change the patch shape and colour; rebuild.
+            self.redraw()
+            return
+        artists[1].set_text(node["text"])
+        self._move_node_artists(node)
+        self._refresh_selection_panel()
+        self.canvas.draw_idle()
 
     def add_node(self):
         nid = simpledialog.askstring("Add node", "Node id (unique):", parent=self.root)
@@ -363,9 +628,11 @@ class DiagramApp:
         canvas = self.spec.get("canvas", {})
         cx = (canvas.get("xlim", [0, 10])[0] + canvas.get("xlim", [0, 10])[1]) / 2
         cy = (canvas.get("ylim", [0, 10])[0] + canvas.get("ylim", [0, 10])[1]) / 2
-        self.spec["nodes"].append({"id": nid, "x": cx, "y": cy, "text": text, "type": ntype})
+        node = {"id": nid, "x": cx, "y": cy, "text": text, "type": ntype}
+        self.spec["nodes"].append(node)
+        self._nodes_by_id[nid] = node
         self.selected_id = nid
-        self.save()
+        self._schedule_save()
         self.redraw()
 
     def delete_node(self):
@@ -377,11 +644,12 @@ class DiagramApp:
                                    f"Delete node '{nid}' and all its edges?"):
             return
         self.spec["nodes"] = [n for n in self.spec["nodes"] if n["id"] != nid]
+        self._nodes_by_id.pop(nid, None)
         self.spec["edges"] = [e for e in self.spec.get("edges", [])
                               if e["from"] != nid and e["to"] != nid]
         self.selected_id = None
-        self.save()
-        self.redraw()
+        self._schedule_save()
+        self.redraw(edges_changed=True)
 
     def add_edge(self):
         src = simpledialog.askstring("Add edge", "From node id:", parent=self.root)
@@ -397,8 +665,8 @@ class DiagramApp:
         if label:
             edge["label"] = label
         self.spec.setdefault("edges", []).append(edge)
-        self.save()
-        self.redraw()
+        self._schedule_save()
+        self.redraw(edges_changed=True)
 
     def delete_edge(self):
         sel = self.edge_list.curselection()
@@ -407,8 +675,8 @@ class DiagramApp:
             return
         idx = sel[0]
         del self.spec["edges"][idx]
-        self.save()
-        self.redraw()
+        self._schedule_save()
+        self.redraw(edges_changed=True)
 
     # ----- zoom -----
 
@@ -428,11 +696,30 @@ class DiagramApp:
         new_xlim = [cx + (x - cx) * factor for x in xlim]
         new_ylim = [cy + (y - cy) * factor for y in ylim]
         self.view = (new_xlim, new_ylim)
-        self.redraw()
+        self._apply_view()
 
     def reset_view(self):
         self.view = None
-        self.redraw()
+        self._apply_view()
+
+    def _apply_view(self):
+        # While the new view stays inside the region the artists were culled
+        # against, only the axes limits need to change.
+        if self._view_covered():
+            xlim, ylim = self._current_view()
+            self.ax.set_xlim(xlim)
+            self.ax.set_ylim(ylim)
+        else:
+            self._render()
+        self.canvas.draw_idle()
+
+    def _view_covered(self) -> bool:
+        if self._rendered_view is None:
+            return True
+        if self.view is None:
+            return False
+        return all(min(outer) <= min(inner) and max(inner) <= max(outer)
+                   for outer, inner in zip(self._rendered_view, self.view))
 
     def _on_scroll(self, event):
         if event.inaxes != self.ax:
@@ -441,10 +728,15 @@ class DiagramApp:
         self.zoom(factor, center=(event.xdata, event.ydata))
 
     def reload(self):
+        self._flush_save()
+        if not self._confirm_unsaved("Reload"):
+            return
+        self._save_error = None
         self.spec = self._load()
+        self._reindex()
         self.selected_id = None
         self.status.set("Reloaded from disk")
-        self.redraw()
+        self.redraw(edges_changed=True)
 
 
 # ---------- entry point ----------